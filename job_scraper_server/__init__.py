@@ -19,6 +19,8 @@ _server: ModuleType = import_module("job_scraper_server.server")
 
 scrape_jobs = _scraper.scrape_jobs  # noqa: F401
 build_search_url = _scraper.build_search_url  # noqa: F401
+cached_jobs = _scraper.cached_jobs  # noqa: F401
+clear_cache = _scraper.clear_cache  # noqa: F401
 ScraperError = _scraper.ScraperError  # noqa: F401
 
 start_server = _server.start_server  # noqa: F401
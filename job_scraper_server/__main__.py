@@ -12,35 +12,21 @@ This tiny *dunder-main* module delegates straight to
 argument handling while providing an additional, idiomatic execution avenue.
 """
 
-from importlib import import_module
 import sys
-from types import ModuleType
 from typing import List
 
 
 def _forward_to_main(argv: List[str]) -> None:  # pragma: no cover – trivial wrapper
-    """Import :pymod:`job_scraper_server.main` and execute its *main* function.
+    """Run :pyfunc:`job_scraper_server.main.main` with the CLI arguments.
 
-    ``main.py`` already provides an executable script style guard::
-
-        if __name__ == "__main__":
-            main()
-
-    We therefore simply *import* the module so its top-level code can parse
-    ``sys.argv``.  The function returns whatever the imported module exits
-    with (usually :pycode:`None`).
+    Merely importing :pymod:`job_scraper_server.main` is not enough: its
+    ``if __name__ == "__main__"`` guard does not fire on import, so the
+    process would exit without ever binding a port.
     """
 
-    # Temporarily replace *sys.argv* so that ``main.py`` sees the same list a
-    # user would expect when invoking ``python -m job_scraper_server``.
-    # ``sys.argv[0]`` should reflect the *command*, not the file path.
-    original_argv = sys.argv
-    sys.argv = ["job_scraper_server"] + argv[1:]
-    try:
-        import_module("job_scraper_server.main")
-    finally:
-        # Restore original argv for downstream code or tests.
-        sys.argv = original_argv
+    from .main import main
+
+    main(argv[1:])
 
 
 # ---------------------------------------------------------------------------
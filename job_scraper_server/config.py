@@ -23,27 +23,104 @@ from typing import Dict, Any, List
 DEFAULT_HOST: str = os.getenv("HOST", "0.0.0.0")
 DEFAULT_PORT: int = int(os.getenv("PORT", "5555"))
 
+# Pending-connection backlog for the listening socket. socketserver defaults
+# to 5, which is easily exceeded while every worker thread is blocked on a
+# slow Monster.com fetch.
+LISTEN_BACKLOG: int = int(os.getenv("LISTEN_BACKLOG", "128"))
+
+# Set SO_REUSEPORT on the listening socket so several server processes can
+# bind the same port and let the kernel spread connections between them.
+REUSE_PORT: bool = os.getenv("REUSE_PORT", "0").lower() in ("1", "true", "yes")
+
+# Default logging level for the CLI; WARNING silences per-request access logs.
+LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO").upper()
+
+# Largest JSON-RPC request body accepted, in bytes. MCP calls are a few
+# hundred bytes; the cap stops a bogus Content-Length from making a handler
+# thread buffer an arbitrarily large body.
+MAX_REQUEST_BYTES: int = 1_000_000
+
+# Seconds an idle keep-alive connection is held open waiting for the next
+# request. Keep this above the idle timeout of any load balancer in front of
+# the server, otherwise it may reuse a connection the server just closed.
+KEEPALIVE_TIMEOUT: float = float(os.getenv("KEEPALIVE_TIMEOUT", "75"))
 
 # Socket recv buffer size (bytes)
 RECV_BUFFER: int = 4096
 
+# Seconds between aggregated request-latency log lines (count/mean/max) from
+# :mod:`job_scraper_server.metrics`; ``0`` disables the summary.
+METRICS_LOG_INTERVAL: float = float(os.getenv("METRICS_LOG_INTERVAL", "60"))
+
 # ---------------------------------------------------------------------------
 # HTTP client settings for the Monster.com scraper
 # ---------------------------------------------------------------------------
 
+# Scheme + host used to absolutise relative job links found on result cards
+MONSTER_ORIGIN: str = "https://www.monster.com"
+
 # Base URL for Monster search result pages
-MONSTER_BASE_URL: str = "https://www.monster.com/jobs/search/"
+MONSTER_BASE_URL: str = MONSTER_ORIGIN + "/jobs/search/"
+
+# Largest search radius in miles that Monster accepts; tools/call rejects more
+MAX_SEARCH_RADIUS: int = 100
+
+# Seconds allowed to establish the TCP/TLS connection to Monster. Kept short
+# so an unreachable host fails fast instead of consuming the read budget.
+CONNECT_TIMEOUT: float = 5
 
-# Request timeout in seconds for the *entire* HTTP request (connect + read)
+# Read timeout in seconds (max wait between bytes of the response)
 REQUEST_TIMEOUT: int = 15
 
+# Upper bound on the (decompressed) result-page bytes read per fetch. Larger
+# pages are truncated, keeping per-request memory bounded under concurrency.
+MAX_RESPONSE_BYTES: int = 2_000_000
+
+# Connection-pool sizing for the shared HTTP session. Keep-alive connections
+# to monster.com are reused across scrapes instead of paying a TCP + TLS
+# handshake per search; maxsize bounds idle sockets kept per host.
+HTTP_POOL_CONNECTIONS: int = 10
+HTTP_POOL_MAXSIZE: int = 20
+
 # Maximum number of retries for transient network failures
 MAX_RETRIES: int = 3
 
-# Seconds to wait between retries – implemented as incremental back-off: the
-# actual delay will be ``RETRY_BACKOFF_BASE * attempt``
+# Seconds to wait between retries – implemented as exponential back-off with
+# full jitter: the actual delay is drawn uniformly from
+# ``[0, RETRY_BACKOFF_BASE * 2 ** (attempt - 1))``
 RETRY_BACKOFF_BASE: float = 1.2
 
+# Upper bound on any single retry delay, including server ``Retry-After`` hints
+RETRY_MAX_DELAY: float = 10.0
+
+# HTTP statuses worth retrying; other 4xx/5xx responses fail immediately
+RETRY_STATUS_CODES: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+
+# Concurrent scrapes allowed per process; further tools/call requests queue.
+# Matches HTTP_POOL_MAXSIZE so every worker can hold a pooled connection.
+SCRAPE_WORKERS: int = HTTP_POOL_MAXSIZE
+
+# Distinct scrapes admitted at once, running plus queued. Beyond this a
+# tools/call is answered "busy" straight away rather than queuing work that
+# would only outlive its caller's deadline.
+SCRAPE_QUEUE_LIMIT: int = 2 * SCRAPE_WORKERS
+
+# Seconds a tools/call waits for its scrape before replying with an error,
+# so retries/back-off never outlast typical MCP client timeouts.
+SCRAPE_DEADLINE: float = 25.0
+
+# ---------------------------------------------------------------------------
+# Scrape result cache
+# ---------------------------------------------------------------------------
+
+# Seconds a scraped result list is served from memory for an identical
+# search. Monster listings change on a minutes-to-hours scale, so a short TTL
+# absorbs agents re-issuing the same query. ``0`` disables caching.
+RESULT_CACHE_TTL: float = float(os.getenv("RESULT_CACHE_TTL", "300"))
+
+# Maximum number of distinct searches kept; least recently used are evicted.
+RESULT_CACHE_MAXSIZE: int = 512
+
 # ---------------------------------------------------------------------------
 # User-Agent pool – basic set of common desktop browsers. This helps reduce the
 # likelihood of being blocked by Monster's anti-bot measures. For serious
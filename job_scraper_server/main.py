@@ -54,9 +54,9 @@ def _build_arg_parser() -> argparse.ArgumentParser:  # pragma: no cover – triv
     parser.add_argument(
         "--log-level",
         metavar="LEVEL",
-        default="INFO",
+        default=config.LOG_LEVEL,
         choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
-        help="Python logging level (default: INFO)",
+        help=f"Python logging level (default: {config.LOG_LEVEL})",
     )
 
     return parser
@@ -75,7 +75,10 @@ def main(argv: List[str] | None = None) -> None:
 
     # Configure root logger *before* the server spins up so that child loggers
     # inherit the chosen level.
-    logging.basicConfig(level=getattr(logging, args.log_level.upper()))
+    logging.basicConfig(
+        level=getattr(logging, args.log_level.upper()),
+        format="%(asctime)s [%(levelname)s] %(message)s",
+    )
 
     start_server(host=args.host, port=args.port)
 
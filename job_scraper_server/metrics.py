@@ -0,0 +1,120 @@
+"""In-process request latency histograms for the MCP HTTP server.
+
+Latencies are counted into fixed power-of-two microsecond buckets, so
+recording a request is a bisect plus a couple of integer increments – no
+allocation and no I/O on the request path.  The accumulated counts are
+rendered on demand in the Prometheus text exposition format by
+:func:`render_prometheus` (served at ``GET /metrics``).
+
+For deployments without a Prometheus scraper, a one-line count/mean/max
+summary is logged once per ``config.METRICS_LOG_INTERVAL`` seconds rather
+than per request.
+"""
+from __future__ import annotations
+
+from bisect import bisect_left
+import logging
+import threading
+import time
+from typing import Dict, List
+
+from . import config
+
+__all__ = ["observe", "render_prometheus"]
+
+# Upper bucket bounds in microseconds: 1µs, 2µs, 4µs … 2**25µs (~33.5s). The
+# range spans sub-millisecond health checks up to retried scrapes.
+_BOUNDS_US: List[int] = [1 << i for i in range(26)]
+
+_METRIC = "mcp_request_duration_seconds"
+
+logger = logging.getLogger(__name__)
+
+
+class _Histogram:
+    """Bucket counts plus running sum for a single label value."""
+
+    __slots__ = ("counts", "sum_us")
+
+    def __init__(self) -> None:
+        # One slot per bound plus the trailing +Inf bucket
+        self.counts: List[int] = [0] * (len(_BOUNDS_US) + 1)
+        self.sum_us: int = 0
+
+
+# HTTP command ("GET", "POST") -> histogram. A single uncontended lock is
+# cheaper in CPython than sharding counters across request threads, which
+# are created per connection and would need registering anyway.
+_HISTOGRAMS: Dict[str, _Histogram] = {}
+_LOCK = threading.Lock()
+
+# Aggregate for the current log window: request count, summed and max µs
+_window_start = time.monotonic()
+_window_count = 0
+_window_sum_us = 0
+_window_max_us = 0
+
+
+def observe(command: str, seconds: float) -> None:
+    """Record that a *command* request took *seconds* to handle."""
+
+    global _window_start, _window_count, _window_sum_us, _window_max_us
+
+    micros = int(seconds * 1_000_000)
+    index = bisect_left(_BOUNDS_US, micros)
+    now = time.monotonic()
+    summary = None
+    with _LOCK:
+        hist = _HISTOGRAMS.get(command)
+        if hist is None:
+            hist = _HISTOGRAMS[command] = _Histogram()
+        hist.counts[index] += 1
+        hist.sum_us += micros
+
+        _window_count += 1
+        _window_sum_us += micros
+        if micros > _window_max_us:
+            _window_max_us = micros
+        interval = config.METRICS_LOG_INTERVAL
+        if interval > 0 and now - _window_start >= interval:
+            summary = (now - _window_start, _window_count, _window_sum_us, _window_max_us)
+            _window_start = now
+            _window_count = _window_sum_us = _window_max_us = 0
+
+    # Emit outside the lock so a slow log handler never blocks other requests
+    if summary is not None:
+        elapsed, count, sum_us, max_us = summary
+        logger.info(
+            "%d requests in %.0fs – mean %.1fms, max %.1fms",
+            count,
+            elapsed,
+            sum_us / count / 1000,
+            max_us / 1000,
+        )
+
+
+def render_prometheus() -> bytes:
+    """Return all histograms in Prometheus text exposition format."""
+
+    with _LOCK:
+        snapshot = {
+            command: (list(hist.counts), hist.sum_us)
+            for command, hist in _HISTOGRAMS.items()
+        }
+
+    lines = [
+        f"# HELP {_METRIC} Time spent handling MCP HTTP requests.",
+        f"# TYPE {_METRIC} histogram",
+    ]
+    for command, (counts, sum_us) in sorted(snapshot.items()):
+        cumulative = 0
+        for bound, count in zip(_BOUNDS_US, counts):
+            cumulative += count
+            lines.append(
+                f'{_METRIC}_bucket{{command="{command}",le="{bound / 1_000_000!r}"}} {cumulative}'
+            )
+        cumulative += counts[-1]
+        lines.append(f'{_METRIC}_bucket{{command="{command}",le="+Inf"}} {cumulative}')
+        lines.append(f'{_METRIC}_sum{{command="{command}"}} {sum_us / 1_000_000!r}')
+        lines.append(f'{_METRIC}_count{{command="{command}"}} {cumulative}')
+    return ("\n".join(lines) + "\n").encode("utf-8")
@@ -17,15 +17,28 @@ practice IP rotation or headless Chrome may be required for large-scale
 scraping – those concerns are outside the scope of this demo implementation.
 """
 
+import atexit
+from collections import OrderedDict
 from dataclasses import asdict
+from functools import lru_cache
+import threading
 import time
 import logging
 import random
-from typing import List, Iterable
-from urllib.parse import quote_plus
+import re
+from typing import List, Iterable, Tuple
+from urllib.parse import urlencode, urljoin
 
 import requests
-from bs4 import BeautifulSoup, Tag
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer, Tag
+import soupsieve
+
+try:  # C-backed parser, several times faster than the pure-Python one
+    import lxml  # noqa: F401
+    _HTML_PARSER = "lxml"
+except ImportError:  # pragma: no cover – depends on the environment
+    _HTML_PARSER = "html.parser"
 
 from . import config
 from .models import Job, Query
@@ -33,6 +46,8 @@ from .models import Job, Query
 __all__ = [
     "ScraperError",
     "build_search_url",
+    "cached_jobs",
+    "clear_cache",
     "scrape_jobs",
 ]
 
@@ -48,11 +63,6 @@ class ScraperError(RuntimeError):
 # URL construction helpers
 # ---------------------------------------------------------------------------
 
-def _keywords_to_query_param(keywords: List[str]) -> str:
-    """Join keyword list with '+' after individual URL encoding."""
-    return "+".join(quote_plus(k) for k in keywords)
-
-
 def build_search_url(query: Query) -> str:
     """Return a Monster.com job-search URL constructed from *query*.
 
@@ -64,50 +74,121 @@ def build_search_url(query: Query) -> str:
     radius  – integer miles (Monster supports 5 .. 100)
     """
 
-    keywords_param = _keywords_to_query_param(query.keywords)
-    location_param = quote_plus(query.location)
-    radius_param = str(query.radius)
+    return _search_url(tuple(query.keywords), query.location, query.radius)
 
-    # Base already ends with '/'; we only append the query string
-    return (
-        f"{config.MONSTER_BASE_URL}?q={keywords_param}"
-        f"&where={location_param}&radius={radius_param}"
-    )
+
+@lru_cache(maxsize=1024)
+def _search_url(keywords: Tuple[str, ...], location: str, radius: int) -> str:
+    """Memoised body of :func:`build_search_url`.
+
+    Agents tend to repeat identical searches, so the URL (which also keys the
+    result cache) is built and percent-encoded only once per distinct query.
+    """
+
+    # urlencode quote_plus-encodes each value, so the space-joined keywords
+    # come out '+' delimited. Base already ends with '/'.
+    params = {"q": " ".join(keywords), "where": location, "radius": radius}
+    return f"{config.MONSTER_BASE_URL}?{urlencode(params)}"
 
 
 # ---------------------------------------------------------------------------
 # Low-level HTTP fetching with retry/backoff
 # ---------------------------------------------------------------------------
 
-def _http_get(url: str) -> str:
-    """GET *url* returning decoded text, with retry/back-off according to config."""
+def _build_session() -> requests.Session:
+    """Return a pooled session shared by every scrape in this process."""
+
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=config.HTTP_POOL_CONNECTIONS,
+        pool_maxsize=config.HTTP_POOL_MAXSIZE,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_SESSION = _build_session()
+atexit.register(_SESSION.close)
+
+
+def _read_capped(response: requests.Response) -> bytes:
+    """Read a streamed *response* body, truncated to ``config.MAX_RESPONSE_BYTES``.
+
+    Job cards sit near the top of the result page, so an outsized page is cut
+    short rather than buffered whole; lxml copes with the truncated markup.
+    """
+
+    limit = config.MAX_RESPONSE_BYTES
+    body = bytearray()
+    for chunk in response.iter_content(chunk_size=64 * 1024):
+        body += chunk
+        if len(body) >= limit:
+            logger.debug("Response body exceeds %s bytes – truncating", limit)
+            del body[limit:]
+            break
+    return bytes(body)
+
+
+def _retry_after_seconds(response: requests.Response) -> float | None:
+    """Return the delay requested by a ``Retry-After: <seconds>`` header, if any."""
+
+    value = response.headers.get("Retry-After", "").strip()
+    # isdecimal(), not isdigit(): the latter also passes e.g. "²", which
+    # float() rejects.
+    return float(value) if value.isdecimal() else None
+
+
+def _http_get(url: str) -> bytes:
+    """GET *url* returning the raw body, with retry/back-off according to config.
+
+    Connection errors and the transient statuses in
+    ``config.RETRY_STATUS_CODES`` are retried with jittered exponential
+    back-off (or the server's ``Retry-After``); other HTTP errors are final.
+
+    The bytes are handed to the HTML parser undecoded: lxml reads the page's
+    own charset declaration natively, which is far cheaper than running
+    ``requests``' statistical ``apparent_encoding`` detection over the body.
+    """
 
     for attempt in range(1, config.MAX_RETRIES + 1):
+        retry_after: float | None = None
         try:
-            response = requests.get(
+            with _SESSION.get(
                 url,
                 headers=config.random_headers(),
-                timeout=config.REQUEST_TIMEOUT,
-            )
-            if response.status_code >= 400:
-                raise ScraperError(
+                timeout=(config.CONNECT_TIMEOUT, config.REQUEST_TIMEOUT),
+                stream=True,
+            ) as response:
+                if response.status_code < 400:
+                    return _read_capped(response)
+                error: Exception = ScraperError(
                     f"Monster returned HTTP {response.status_code} for GET {url}"
                 )
-            response.encoding = response.apparent_encoding or "utf-8"
-            return response.text
-        except (requests.RequestException, ScraperError) as exc:
-            if attempt >= config.MAX_RETRIES:
-                raise ScraperError("Failed to fetch Monster search page") from exc
-
-            backoff = config.RETRY_BACKOFF_BASE * attempt * random.random()
-            logger.debug(
-                "HTTP GET failed (attempt %s/%s): %s – retrying in %.1fs",
-                attempt,
-                config.MAX_RETRIES,
-                exc,
-                backoff,
-            )
-            time.sleep(backoff)
+                if response.status_code not in config.RETRY_STATUS_CODES:
+                    raise error
+                retry_after = _retry_after_seconds(response)
+        except requests.RequestException as exc:
+            error = exc
+
+        if attempt >= config.MAX_RETRIES:
+            raise ScraperError("Failed to fetch Monster search page") from error
+
+        if retry_after is not None:
+            backoff = min(retry_after, config.RETRY_MAX_DELAY)
+        else:
+            backoff = min(
+                config.RETRY_BACKOFF_BASE * 2 ** (attempt - 1),
+                config.RETRY_MAX_DELAY,
+            ) * random.random()
+        logger.debug(
+            "HTTP GET failed (attempt %s/%s): %s – retrying in %.1fs",
+            attempt,
+            config.MAX_RETRIES,
+            error,
+            backoff,
+        )
+        time.sleep(backoff)
 
     # unreached – loop either returns or raises
 
@@ -135,14 +216,54 @@ _JOB_CARD_SELECTORS = [
     "div.flex-row",  # fallback
 ]
 
+# Restrict tree building to the job-card subtrees so the parser skips the
+# navigation, inline scripts and footer that make up most of a result page.
+# Must match every entry in ``_JOB_CARD_SELECTORS``. The class is matched as a
+# whitespace-separated token: with a plain string list, current bs4 compares
+# against the whole attribute value and drops multi-class cards.
+_CARD_STRAINER = SoupStrainer(
+    ["section", "div"],
+    class_=re.compile(r"(?:^|\s)(?:card-content|flex-row)(?:\s|$)"),
+)
+
+# Compile every selector once at import. ``Tag.select_one(str)`` would go
+# through soupsieve's compile cache again for every selector of every card.
+_TITLE_PATTERNS = [soupsieve.compile(sel) for sel in _TITLE_SELECTORS]
+_COMPANY_PATTERNS = [soupsieve.compile(sel) for sel in _COMPANY_SELECTORS]
+_SNIPPET_PATTERNS = [soupsieve.compile(sel) for sel in _SNIPPET_SELECTORS]
+_JOB_CARD_PATTERNS = [soupsieve.compile(sel) for sel in _JOB_CARD_SELECTORS]
+
 
 def _extract_first_text(elem: Tag | None) -> str | None:
     if elem is None:
         return None
-    text = elem.get_text(strip=True)
+    # Leaf elements (company names, most titles) expose their single text
+    # node directly; only walk all descendants for mixed content. The exact
+    # type check matters: ``.string`` also returns a lone Comment or CData
+    # child, which get_text() deliberately skips.
+    text = elem.string
+    if type(text) is NavigableString:
+        text = text.strip()
+    else:
+        text = elem.get_text(strip=True)
     return text or None
 
 
+def _absolute_link(href: str) -> str:
+    """Resolve a card *href* against the search results page.
+
+    Card links are nearly always root-relative (``/job-openings/...``), so that
+    case is a plain string concatenation – no need to ``urlparse`` both sides
+    via :func:`urllib.parse.urljoin` for every card. Anything else that isn't
+    already absolute falls back to ``urljoin``.
+    """
+    if href[:8].lower().startswith(("http://", "https://")):
+        return href
+    if href.startswith("/") and not href.startswith("//"):
+        return config.MONSTER_ORIGIN + href
+    return urljoin(config.MONSTER_BASE_URL, href)
+
+
 def _parse_job_card(card: Tag) -> Job | None:
     """Parse a BeautifulSoup *card* element into a Job dataclass.
 
@@ -150,10 +271,10 @@ def _parse_job_card(card: Tag) -> Job | None:
     """
 
     title = link = None
-    for sel in _TITLE_SELECTORS:
-        anchor = card.select_one(sel)
-        if anchor and anchor.get_text(strip=True):
-            title = anchor.get_text(strip=True)
+    for pattern in _TITLE_PATTERNS:
+        anchor = pattern.select_one(card)
+        title = _extract_first_text(anchor)
+        if title:
             link = anchor.get("href")
             break
 
@@ -162,26 +283,86 @@ def _parse_job_card(card: Tag) -> Job | None:
         return None
 
     company = None
-    for sel in _COMPANY_SELECTORS:
-        val = _extract_first_text(card.select_one(sel))
+    for pattern in _COMPANY_PATTERNS:
+        val = _extract_first_text(pattern.select_one(card))
         if val:
             company = val
             break
 
     description = None
-    for sel in _SNIPPET_SELECTORS:
-        val = _extract_first_text(card.select_one(sel))
+    for pattern in _SNIPPET_PATTERNS:
+        val = _extract_first_text(pattern.select_one(card))
         if val:
             description = val
             break
 
-    return Job(title=title, company=company, description=description, link=link)
+    return Job(
+        title=title,
+        company=company,
+        description=description,
+        link=_absolute_link(link),
+    )
+
+
+# ---------------------------------------------------------------------------
+# In-process TTL cache of scrape results
+# ---------------------------------------------------------------------------
+
+_CacheKey = Tuple[str, "int | None"]
+
+# key -> (expiry on the monotonic clock, jobs); ordered least recently used first
+_RESULT_CACHE: "OrderedDict[_CacheKey, Tuple[float, List[Job]]]" = OrderedDict()
+_CACHE_LOCK = threading.Lock()
+
+
+def _cache_get(key: _CacheKey) -> List[Job] | None:
+    """Return a copy of the cached jobs for *key*, or None if absent/expired."""
+
+    with _CACHE_LOCK:
+        entry = _RESULT_CACHE.get(key)
+        if entry is None:
+            return None
+        expires, jobs = entry
+        if expires <= time.monotonic():
+            del _RESULT_CACHE[key]
+            return None
+        _RESULT_CACHE.move_to_end(key)
+        return list(jobs)
+
+
+def _cache_put(key: _CacheKey, jobs: List[Job]) -> None:
+    """Store *jobs* under *key*, evicting the least recently used entries."""
+
+    if config.RESULT_CACHE_TTL <= 0:
+        return
+    with _CACHE_LOCK:
+        _RESULT_CACHE[key] = (time.monotonic() + config.RESULT_CACHE_TTL, list(jobs))
+        _RESULT_CACHE.move_to_end(key)
+        while len(_RESULT_CACHE) > config.RESULT_CACHE_MAXSIZE:
+            _RESULT_CACHE.popitem(last=False)
 
 
 # ---------------------------------------------------------------------------
 # Public scraper API
 # ---------------------------------------------------------------------------
 
+def clear_cache() -> None:
+    """Drop every cached scrape result so the next searches hit Monster."""
+
+    with _CACHE_LOCK:
+        _RESULT_CACHE.clear()
+
+
+def cached_jobs(query: Query, *, max_results: int | None = None) -> List[Job] | None:
+    """Return the cached result of an identical recent :func:`scrape_jobs` call.
+
+    ``None`` means nothing usable is cached. Never touches the network, so
+    callers can answer from memory before queuing a scrape.
+    """
+
+    return _cache_get((build_search_url(query), max_results))
+
+
 def scrape_jobs(query: Query, *, max_results: int | None = None) -> List[Job]:
     """Scrape Monster.com for *query* returning a list of `Job`.
 
@@ -192,17 +373,27 @@ def scrape_jobs(query: Query, *, max_results: int | None = None) -> List[Job]:
     max_results : int | None, optional
         Optional limit to stop parsing after N results.  `None` returns all
         jobs found on the initial result page.
+
+    Identical searches within ``config.RESULT_CACHE_TTL`` seconds are served
+    from an in-process cache without contacting Monster. Searches that found
+    no jobs are not cached.
     """
 
     url = build_search_url(query)
+    cache_key = (url, max_results)
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        logger.debug("Serving cached results for %s", url)
+        return cached
+
     logger.debug("Fetching Monster search page: %s", url)
     html = _http_get(url)
 
-    soup = BeautifulSoup(html, "lxml")
+    soup = BeautifulSoup(html, _HTML_PARSER, parse_only=_CARD_STRAINER)
 
     cards: Iterable[Tag] = []
-    for sel in _JOB_CARD_SELECTORS:
-        found = soup.select(sel)
+    for pattern in _JOB_CARD_PATTERNS:
+        found = pattern.select(soup)
         if found:
             cards = found
             break
@@ -215,4 +406,8 @@ def scrape_jobs(query: Query, *, max_results: int | None = None) -> List[Job]:
             if max_results is not None and len(jobs) >= max_results:
                 break
 
+    # An empty page is more often an anti-bot interstitial or a layout the
+    # selectors no longer match than a genuine "no results"; don't pin it.
+    if jobs:
+        _cache_put(cache_key, jobs)
     return jobs
@@ -6,27 +6,40 @@ This module houses the network-facing server that implements the MCP 'tools'
 capability. It understands JSON-RPC 2.0 and provides two methods:
 - tools/list: To discover the `search_jobs` tool.
 - tools/call: To execute a job search.
+
+GET requests are health checks, except ``GET /metrics`` which exposes request
+latency histograms in Prometheus format.
 """
 
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from http.server import BaseHTTPRequestHandler, HTTPServer
 from socketserver import ThreadingMixIn
 import json
 import logging
-from typing import Any, Dict, Type
+import threading
+import time
+from typing import Any, Dict, List, Type
+
+try:  # Optional: compiled JSON encoder, several times faster than stdlib json
+    import orjson
+except ImportError:  # pragma: no cover – depends on the environment
+    orjson = None
 
-from . import config
+from . import config, metrics
 from .models import Job, Query
-from .scraper import scrape_jobs
+from .scraper import build_search_url, cached_jobs, scrape_jobs
 
 __all__ = ["start_server", "MCPHttpRequestHandler", "ThreadedHTTPServer"]
 
 # ---------------------------------------------------------------------------
 # Logging setup
 # ---------------------------------------------------------------------------
+# Handlers and level are configured by the CLI (see ``main.py``); configuring
+# the root logger here at import time would pin it to INFO and make
+# ``--log-level`` a no-op, so every access line would always be formatted.
 
 logger = logging.getLogger("job_scraper_server")
-if not logger.handlers:
-    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
 
 # ---------------------------------------------------------------------------
 # MCP Tool Definition
@@ -50,13 +63,173 @@ SEARCH_JOBS_TOOL = {
             "radius": {
                 "type": "integer",
                 "description": "The search radius in miles.",
-                "default": 10
+                "default": 10,
+                "minimum": 1,
+                "maximum": config.MAX_SEARCH_RADIUS
             }
         },
         "required": ["keywords", "location"]
     }
 }
 
+# ---------------------------------------------------------------------------
+# Pre-serialised static payloads
+# ---------------------------------------------------------------------------
+# Health checks and tools/list are polled far more often than tools/call and
+# always return the same data, so their JSON is encoded once at import time.
+
+
+def _encode(obj: Any) -> bytes:
+    """Serialise *obj* into compact UTF-8 JSON bytes, via orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _decode(raw: bytes) -> Any:
+    """Parse a JSON request body, via orjson when available.
+
+    ``orjson.JSONDecodeError`` subclasses :class:`json.JSONDecodeError`, so
+    callers only need to handle the stdlib exception.
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+_HEALTH_BODY: bytes = _encode({"status": "ok"})
+_TOOLS_LIST_RESULT: bytes = _encode({"tools": [SEARCH_JOBS_TOOL]})
+
+# Error objects for malformed requests carry no per-request detail, so they
+# are encoded once too; only the id is spliced in (see _send_encoded_error).
+_ERR_NO_BODY: bytes = _encode({"code": -32700, "message": "Parse error", "data": "Missing Content-Length"})
+_ERR_PARSE: bytes = _encode({"code": -32700, "message": "Parse error", "data": "Invalid JSON was received by the server."})
+_ERR_TOO_LARGE: bytes = _encode({"code": -32600, "message": "Invalid Request", "data": "Request body too large"})
+_ERR_INVALID: bytes = _encode({"code": -32600, "message": "Invalid Request", "data": "Not a valid JSON-RPC 2.0 request"})
+
+_METRICS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _build_query(arguments: Any) -> Query | str:
+    """Validate search_jobs *arguments* into a :class:`Query`.
+
+    Returns an error message instead of raising, so malformed input from a
+    client is an ordinary branch rather than an exception.
+    """
+    if not isinstance(arguments, dict):
+        return "arguments must be an object"
+    keywords = arguments.get("keywords")
+    location = arguments.get("location")
+    if not isinstance(keywords, str) or not keywords.split():
+        return "Missing required argument: 'keywords'"
+    if not isinstance(location, str) or not location.strip():
+        return "Missing required argument: 'location'"
+
+    radius = arguments.get("radius", 10)
+    invalid_radius = f"'radius' must be an integer from 1 to {config.MAX_SEARCH_RADIUS}"
+    if type(radius) is not int:
+        # Accept numeric strings, but not floats or bools which int() would
+        # truncate. The length check keeps int() away from huge digit strings.
+        if not isinstance(radius, str):
+            return invalid_radius
+        radius = radius.strip()
+        if not radius.isdecimal() or len(radius) > len(str(config.MAX_SEARCH_RADIUS)):
+            return invalid_radius
+        radius = int(radius)
+    if not 0 < radius <= config.MAX_SEARCH_RADIUS:
+        return invalid_radius
+
+    return Query(keywords=keywords.split(), location=location.strip(), radius=radius)
+
+
+# ---------------------------------------------------------------------------
+# Scrape execution
+# ---------------------------------------------------------------------------
+# Scrapes run on a bounded pool so that concurrent tools/call requests cannot
+# open an unbounded number of connections to Monster, and so each call can
+# be abandoned after ``config.SCRAPE_DEADLINE`` seconds. Identical searches
+# that arrive while one is already running share its future, and searches
+# already in the result cache are answered on the request thread without
+# touching the pool at all.
+#
+# Admission is capped at ``config.SCRAPE_QUEUE_LIMIT`` distinct scrapes, and a
+# scrape that has not started yet is cancelled once its last waiter gives up,
+# so an overloaded server sheds work instead of growing an unbounded queue.
+#
+# Each ThreadedHTTPServer owns its pool. Pool workers are not daemonic:
+# interpreter exit still joins scrapes that are already running (queued ones
+# are cancelled by ``server_close``). Each is bounded by the timeouts and
+# retry limits in ``scraper._http_get``.
+
+_SCRAPE_SLOTS = threading.BoundedSemaphore(config.SCRAPE_QUEUE_LIMIT)
+
+
+class _Inflight:
+    """A submitted scrape plus the number of requests waiting on it."""
+
+    __slots__ = ("future", "waiters")
+
+    def __init__(self, future: "Future[List[Job]]") -> None:
+        self.future = future
+        self.waiters = 1
+
+
+_INFLIGHT: Dict[str, _Inflight] = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+
+def _submit_scrape(pool: ThreadPoolExecutor, query: Query) -> "Future[List[Job]] | None":
+    """Return a future for *query*, joining an identical in-flight scrape.
+
+    New scrapes run on *pool*. Returns ``None`` when
+    ``config.SCRAPE_QUEUE_LIMIT`` scrapes are already admitted. Every future returned must be handed back to
+    :func:`_release_scrape` once the caller stops waiting on it.
+    """
+
+    key = build_search_url(query)
+    with _INFLIGHT_LOCK:
+        entry = _INFLIGHT.get(key)
+        if entry is not None:
+            entry.waiters += 1
+            return entry.future
+        if not _SCRAPE_SLOTS.acquire(blocking=False):
+            return None
+        try:
+            future = pool.submit(scrape_jobs, query)
+        except BaseException:
+            # e.g. RuntimeError once the pool is shut down
+            _SCRAPE_SLOTS.release()
+            raise
+        _INFLIGHT[key] = _Inflight(future)
+
+    def _forget(done: "Future[List[Job]]") -> None:
+        _SCRAPE_SLOTS.release()
+        with _INFLIGHT_LOCK:
+            entry = _INFLIGHT.get(key)
+            if entry is not None and entry.future is done:
+                del _INFLIGHT[key]
+
+    # Registered outside the lock: it runs immediately if already finished.
+    future.add_done_callback(_forget)
+    return future
+
+
+def _release_scrape(query: Query, future: "Future[List[Job]]") -> None:
+    """Drop one waiter on *future*, cancelling it if nobody waits and it hasn't started."""
+
+    key = build_search_url(query)
+    with _INFLIGHT_LOCK:
+        entry = _INFLIGHT.get(key)
+        if entry is None or entry.future is not future:
+            return
+        entry.waiters -= 1
+        if entry.waiters > 0 or future.running() or future.done():
+            return
+        # Unlisted first so no new request joins a future about to be cancelled
+        del _INFLIGHT[key]
+    # Outside the lock: a successful cancel() runs _forget synchronously
+    future.cancel()
+
 
 # ---------------------------------------------------------------------------
 # HTTP Server Implementation
@@ -64,87 +237,177 @@ SEARCH_JOBS_TOOL = {
 
 
 class ThreadedHTTPServer(ThreadingMixIn, HTTPServer):
-    """Enable concurrent requests by mixing in ThreadingMixIn."""
+    """Enable concurrent requests by mixing in ThreadingMixIn.
+
+    Each request runs on its own thread, so a scrape blocked on network I/O
+    never holds up health checks or tools/list.  Threads are daemonic so that
+    shutdown does not wait for requests still blocked on a scrape; the
+    server's ``scrape_pool`` is joined at exit (see the note above
+    ``_SCRAPE_SLOTS``).
+    """
     allow_reuse_address = True
+    allow_reuse_port = config.REUSE_PORT
+    daemon_threads = True
+    request_queue_size = config.LISTEN_BACKLOG
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Owned per server so closing one never strands scrapes of another
+        self.scrape_pool = ThreadPoolExecutor(
+            max_workers=config.SCRAPE_WORKERS, thread_name_prefix="scrape"
+        )
+
+    def server_close(self):
+        """Close the socket and cancel scrapes still queued on this server's pool."""
+        super().server_close()
+        self.scrape_pool.shutdown(wait=False, cancel_futures=True)
 
 
 class MCPHttpRequestHandler(BaseHTTPRequestHandler):
-    """Handles MCP JSON-RPC requests."""
+    """Handles MCP JSON-RPC requests.
+
+    Speaks HTTP/1.1 so clients can reuse one connection for successive
+    calls; every response therefore carries an explicit Content-Length.
+    """
+
+    protocol_version = "HTTP/1.1"
+    # Idle keep-alive connections are dropped after this many seconds
+    timeout = config.KEEPALIVE_TIMEOUT
 
     def do_GET(self):
-        """Handle GET requests, typically for health checks."""
-        self.send_response(200)
-        self.send_header("Content-Type", "application/json")
+        """Handle GET requests: ``/metrics`` for Prometheus, else a health check."""
+        started = time.perf_counter()
+        self._close_if_body_unread()
+        if self.path.partition("?")[0] == "/metrics":
+            self._send_body(200, metrics.render_prometheus(), _METRICS_CONTENT_TYPE)
+        else:
+            self._send_body(200, _HEALTH_BODY)
+        metrics.observe("GET", time.perf_counter() - started)
+
+    def do_OPTIONS(self):
+        """Answer OPTIONS probes with an empty 204 listing the allowed methods.
+
+        Without this, http.server replies 501 with an HTML error page.
+        """
+        self._close_if_body_unread()
+        self.send_response(204)
+        # No Content-Length: a 204 never has a body (RFC 9110 section 8.6)
+        self.send_header("Allow", "GET, POST, OPTIONS")
+        if self.close_connection:
+            self.send_header("Connection", "close")
         self.end_headers()
-        self.wfile.write(b'{"status": "ok"}')
+
+    def _close_if_body_unread(self, *, reads_content_length=False):
+        """Mark the connection for closing if the request body won't be consumed.
+
+        Unread body bytes would otherwise be parsed as the next request on a
+        kept-alive stream. A transfer-coded (e.g. chunked) body is never read;
+        a Content-Length body only by handlers that pass *reads_content_length*.
+        """
+        if "Transfer-Encoding" in self.headers or (
+            not reads_content_length
+            and self.headers.get("Content-Length", "0").strip() != "0"
+        ):
+            self.close_connection = True
 
     def do_POST(self):
         """Handle POST requests containing JSON-RPC commands."""
+        started = time.perf_counter()
+        try:
+            self._handle_json_rpc()
+        finally:
+            metrics.observe("POST", time.perf_counter() - started)
+
+    def _handle_json_rpc(self):
+        """Parse the request body and dispatch it to the matching method handler."""
+        # Bound before anything can raise so the error paths below never have
+        # to probe whether the body was parsed.
+        request_id = None
+        self._close_if_body_unread(reads_content_length=True)
         try:
             content_length = int(self.headers.get('Content-Length', 0))
-            if not content_length:
-                self._send_json_rpc_error(-32700, "Parse error", "Missing Content-Length", None)
+            if content_length <= 0:
+                self._send_encoded_error(_ERR_NO_BODY, None)
+                return
+            if content_length > config.MAX_REQUEST_BYTES:
+                self.close_connection = True
+                self._send_encoded_error(_ERR_TOO_LARGE, None)
                 return
 
             raw_body = self.rfile.read(content_length)
-            data = json.loads(raw_body)
+            data = _decode(raw_body)
+
+            if not isinstance(data, dict):
+                self._send_encoded_error(_ERR_INVALID, None)
+                return
 
             request_id = data.get("id")
             if data.get("jsonrpc") != "2.0" or "method" not in data:
-                self._send_json_rpc_error(-32600, "Invalid Request", "Not a valid JSON-RPC 2.0 request", request_id)
+                self._send_encoded_error(_ERR_INVALID, request_id)
                 return
 
             method = data["method"]
             params = data.get("params", {})
 
-            if method == "tools/list":
-                self._handle_tools_list(request_id)
-            elif method == "tools/call":
-                self._handle_tools_call(request_id, params)
-            else:
+            handler = self._METHODS.get(method) if isinstance(method, str) else None
+            if handler is None:
                 self._send_json_rpc_error(-32601, "Method not found", f"The method '{method}' does not exist.", request_id)
+                return
+            handler(self, request_id, params)
 
         except json.JSONDecodeError:
-            self._send_json_rpc_error(-32700, "Parse error", "Invalid JSON was received by the server.", None)
+            self._send_encoded_error(_ERR_PARSE, None)
         except Exception as e:
             logger.exception("An unexpected error occurred while processing the request.")
-            self._send_json_rpc_error(-32603, "Internal error", str(e), data.get("id"))
+            # The body may not have been consumed, so the stream can't be reused
+            self.close_connection = True
+            self._send_json_rpc_error(-32603, "Internal error", str(e), request_id)
 
-    def _handle_tools_list(self, request_id):
+    def _handle_tools_list(self, request_id, params):
         """Handle the tools/list request."""
-        result = {
-            "tools": [SEARCH_JOBS_TOOL],
-        }
-        self._send_json_rpc_response(result, request_id)
+        self._send_encoded_result(_TOOLS_LIST_RESULT, request_id)
 
     def _handle_tools_call(self, request_id, params):
         """Handle the tools/call request."""
+        if not isinstance(params, dict):
+            self._send_json_rpc_error(-32602, "Invalid params", "params must be an object", request_id)
+            return
         tool_name = params.get("name")
-        arguments = params.get("arguments", {})
+        arguments = params.get("arguments") or {}
 
         if tool_name != "search_jobs":
             self._send_json_rpc_error(-32602, "Invalid params", f"Unknown tool name: {tool_name}", request_id)
             return
 
-        try:
-            query = Query(
-                keywords=arguments.get("keywords"),
-                location=arguments.get("location"),
-                radius=arguments.get("radius", 10)
-            )
-        except KeyError as e:
-            self._send_json_rpc_error(-32602, "Invalid params", f"Missing required argument: {e}", request_id)
+        query = _build_query(arguments)
+        if isinstance(query, str):
+            self._send_json_rpc_error(-32602, "Invalid params", query, request_id)
+            return
+
+        jobs = cached_jobs(query)
+        if jobs is not None:
+            self._send_jobs(jobs, request_id)
+            return
+
+        future = _submit_scrape(self.server.scrape_pool, query)
+        if future is None:
+            logger.warning("Scrape queue full; rejecting search for %s", query)
+            result = {
+                "content": [{"type": "text", "text": "The server is busy; please try again shortly."}],
+                "isError": True
+            }
+            self._send_json_rpc_response(result, request_id)
             return
 
         try:
-            jobs = scrape_jobs(query)
-            content = [{"type": "text", "text": f"{job.title} at {job.company}\n{job.snippet}\n{job.link}\n"} for job in jobs]
-            if not content:
-                content = [{"type": "text", "text": "No jobs found matching your criteria."}]
+            jobs = future.result(timeout=config.SCRAPE_DEADLINE)
+            self._send_jobs(jobs, request_id)
 
+        except FuturesTimeoutError:
+            logger.warning("Scrape exceeded %ss deadline for %s", config.SCRAPE_DEADLINE, query)
             result = {
-                "content": content,
-                "isError": False
+                "content": [{"type": "text", "text": "Job search timed out; please try again shortly."}],
+                "isError": True
             }
             self._send_json_rpc_response(result, request_id)
 
@@ -156,6 +419,27 @@ class MCPHttpRequestHandler(BaseHTTPRequestHandler):
             }
             self._send_json_rpc_response(result, request_id)
 
+        finally:
+            _release_scrape(query, future)
+
+    def _send_jobs(self, jobs, request_id):
+        """Send a successful tools/call result listing *jobs*."""
+        content = [{"type": "text", "text": f"{job.title} at {job.company}\n{job.description}\n{job.link}\n"} for job in jobs]
+        if not content:
+            content = [{"type": "text", "text": "No jobs found matching your criteria."}]
+
+        result = {
+            "content": content,
+            "isError": False
+        }
+        self._send_json_rpc_response(result, request_id)
+
+    # JSON-RPC method name -> handler(self, request_id, params)
+    _METHODS = {
+        "tools/list": _handle_tools_list,
+        "tools/call": _handle_tools_call,
+    }
+
     def _send_json_rpc_response(self, result, request_id):
         """Sends a successful JSON-RPC response."""
         response_payload = {
@@ -165,6 +449,22 @@ class MCPHttpRequestHandler(BaseHTTPRequestHandler):
         }
         self._send_response(200, response_payload)
 
+    def _send_encoded_result(self, result_bytes, request_id):
+        """Sends a successful JSON-RPC response around an already-encoded result."""
+        body = (
+            b'{"jsonrpc":"2.0","id":' + _encode(request_id)
+            + b',"result":' + result_bytes + b"}"
+        )
+        self._send_body(200, body)
+
+    def _send_encoded_error(self, error_bytes, request_id):
+        """Sends a JSON-RPC error response around an already-encoded error object."""
+        body = (
+            b'{"jsonrpc":"2.0","id":' + _encode(request_id)
+            + b',"error":' + error_bytes + b"}"
+        )
+        self._send_body(200, body)
+
     def _send_json_rpc_error(self, code, message, data, request_id):
         """Sends a JSON-RPC error response."""
         response_payload = {
@@ -179,16 +479,58 @@ class MCPHttpRequestHandler(BaseHTTPRequestHandler):
         self._send_response(200, response_payload) # JSON-RPC errors usually use 200 OK for transport
 
     def _send_response(self, status_code, payload):
-        """Helper to send a JSON response."""
+        """Helper to send a JSON response.
+
+        The payload is serialised exactly once; if that fails the client still
+        receives a JSON-RPC internal error instead of a dropped connection.
+        """
+        try:
+            response_bytes = _encode(payload)
+        except (TypeError, ValueError) as e:
+            logger.exception("Failed to encode response: %s", e)
+            response_bytes = _encode({
+                "jsonrpc": "2.0",
+                "id": payload.get("id"),
+                "error": {
+                    "code": -32603,
+                    "message": "Internal error",
+                    "data": "Response is not JSON serialisable",
+                },
+            })
+        self._send_body(status_code, response_bytes)
+
+    def _send_body(self, status_code, body, content_type="application/json"):
+        """Write pre-encoded *body* with the matching headers."""
         try:
-            response_bytes = json.dumps(payload).encode("utf-8")
             self.send_response(status_code)
-            self.send_header("Content-Type", "application/json")
-            self.send_header("Content-Length", str(len(response_bytes)))
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            if self.close_connection:
+                # Tell the client not to reuse the socket, e.g. because the
+                # request body was left unread and the stream is out of sync.
+                self.send_header("Connection", "close")
             self.end_headers()
-            self.wfile.write(response_bytes)
+            self.wfile.write(body)
         except Exception as e:
             logger.exception("Failed to send response: %s", e)
+            self.close_connection = True
+
+    def log_request(self, code="-", size="-"):
+        """Skip access logging for health-check GETs unless DEBUG is enabled.
+
+        Orchestrator liveness probes poll GET at high frequency; formatting
+        and emitting a line for each one is pure overhead.
+        """
+        if self.command == "GET" and not logger.isEnabledFor(logging.DEBUG):
+            return
+        super().log_request(code, size)
+
+    def log_error(self, format, *args):
+        """Demote idle keep-alive timeouts to DEBUG; other errors log as usual."""
+        if format.startswith("Request timed out"):
+            logger.debug(format, *args)
+            return
+        super().log_error(format, *args)
 
     def log_message(self, format, *args):
         """Override to log to our logger instead of stderr."""
@@ -0,0 +1,76 @@
+"""Tests for the Monster.com result-page parsing in :mod:`job_scraper_server.scraper`."""
+from __future__ import annotations
+
+import pytest
+
+from job_scraper_server import scraper
+from job_scraper_server.models import Query
+
+# Cards carrying extra classes next to the ones the selectors look for, as
+# Monster's markup often does.
+MULTI_CLASS_PAGE = b"""
+<html><body>
+  <nav class="flex">navigation</nav>
+  <section class="card-content big">
+    <h2 class="title"><a href="/job-openings/one">One</a></h2>
+    <div class="company"><span class="name">ACME</span></div>
+  </section>
+  <section class="card-content">
+    <h2 class="title"><a href="/job-openings/two">Two</a></h2>
+  </section>
+</body></html>
+"""
+
+FLEX_ROW_PAGE = b"""
+<html><body>
+  <div class="flex-row highlighted">
+    <h2 class="card-title"><a href="job/3">Three</a></h2>
+  </div>
+</body></html>
+"""
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    scraper.clear_cache()
+    yield
+    scraper.clear_cache()
+
+
+def _serve(monkeypatch, page: bytes) -> None:
+    monkeypatch.setattr(scraper, "_http_get", lambda url: page)
+
+
+def test_multi_class_cards_are_parsed(monkeypatch):
+    _serve(monkeypatch, MULTI_CLASS_PAGE)
+
+    jobs = scraper.scrape_jobs(Query(["python"], "Austin, TX"))
+
+    assert [job.title for job in jobs] == ["One", "Two"]
+    assert jobs[0].company == "ACME"
+    assert jobs[0].link == "https://www.monster.com/job-openings/one"
+
+
+def test_multi_class_fallback_cards_are_parsed(monkeypatch):
+    _serve(monkeypatch, FLEX_ROW_PAGE)
+
+    jobs = scraper.scrape_jobs(Query(["python"], "Austin, TX"))
+
+    assert [job.title for job in jobs] == ["Three"]
+    assert jobs[0].link == "https://www.monster.com/jobs/search/job/3"
+
+
+def test_empty_results_are_not_cached(monkeypatch):
+    fetched = []
+
+    def fake_get(url):
+        fetched.append(url)
+        return b"<html><body><div class='interstitial'>Checking...</div></body></html>"
+
+    monkeypatch.setattr(scraper, "_http_get", fake_get)
+    query = Query(["python"], "Austin, TX")
+
+    assert scraper.scrape_jobs(query) == []
+    assert scraper.scrape_jobs(query) == []
+    assert len(fetched) == 2
+    assert scraper.cached_jobs(query) is None